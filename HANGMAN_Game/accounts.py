@@ -1,11 +1,37 @@
+import hashlib
+import hmac
 import string
 import random
 import pathlib
-from typing import Dict, Any, Tuple, Optional
+import time
+from typing import Dict, Any, Set, Tuple, Optional
 from display import (
     display_login_header, display_register_header, 
     display_password_requirements, get_user_name
 )
+from storage import save_accounts
+
+# Character classes used by validate_password (built once at import)
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_SYMBOLS = frozenset(string.punctuation)
+
+# Character pools used by generate_password
+_PW_SYMBOLS = "!@#$%^&*"          # Safe symbols (avoiding problematic ones)
+_PW_REQUIRED = (string.ascii_lowercase, string.ascii_uppercase, string.digits, _PW_SYMBOLS)
+_PW_POOL = string.ascii_letters + string.digits + _PW_SYMBOLS
+_PW_RNG = random.SystemRandom()   # OS entropy for generated passwords
+
+# Usernames whose accounts changed in memory; written to disk by flush_accounts
+_dirty_usernames: Set[str] = set()
+
+# Failed password attempts per username, used for login back-off
+_fail_counts: Dict[str, int] = {}
+_MAX_BACKOFF_SECONDS = 30
+
+# Formatted summaries keyed by the account values they display
+_summary_cache: Dict[Tuple[Any, ...], str] = {}
 
 def create_account(name: str, username: str, password: str) -> Dict[str, Any]:
     """
@@ -14,7 +40,7 @@ def create_account(name: str, username: str, password: str) -> Dict[str, Any]:
     Args:
         name (str): Display name for the account
         username (str): Unique username for login
-        password (str): Account password
+        password (str): Account password (only its hash is stored)
         
     Returns:
         Dict[str, Any]: Complete account dictionary with statistics initialized to zero
@@ -22,7 +48,7 @@ def create_account(name: str, username: str, password: str) -> Dict[str, Any]:
     return {
         "name": name,
         "username": username,
-        "password": password,
+        "password_hash": hash_password(password),
         "wins": 0,                  # Total lifetime wins
         "losses": 0,                # Total lifetime losses
         "plays": 0,                 # Total lifetime games played
@@ -54,12 +80,86 @@ def add_session_to_totals(account: Dict[str, Any]) -> None:
     account["wins"] += account["session_wins"]
     account["losses"] += account["session_losses"]
     account["plays"] += account["session_plays"]
+    mark_accounts_dirty(account["username"])
     
     # Reset session counters (optional - depends on requirements)
     # account["session_wins"] = 0
     # account["session_losses"] = 0
     # account["session_plays"] = 0
 
+def mark_accounts_dirty(username: str) -> None:
+    """
+    Record that an in-memory account has changes not yet saved to file.
+    
+    Args:
+        username (str): Username of the changed account
+    """
+    _dirty_usernames.add(username)
+
+def flush_accounts(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path) -> bool:
+    """
+    Save changed accounts to file, but only if something changed since the last save.
+    Called on logout and exit so a session does a single write. Only the
+    changed records are rewritten where the storage layer can manage it.
+    
+    Args:
+        accounts (Dict[str, Dict[str, Any]]): All user accounts
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        
+    Returns:
+        bool: True if accounts were written, False if there was nothing to save
+        or the save failed (changes are kept for the next flush)
+    """
+    if not _dirty_usernames:
+        return False
+    
+    if not save_accounts(accounts, accounts_file, dirty=_dirty_usernames):
+        return False
+    
+    _dirty_usernames.clear()
+    return True
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password for storage.
+    
+    Args:
+        password (str): Plaintext password
+        
+    Returns:
+        str: SHA-256 hex digest of the password
+    """
+    return hashlib.sha256(password.encode()).hexdigest()
+
+def check_password(account: Dict[str, Any], password: str) -> bool:
+    """
+    Check a password against an account using a constant-time comparison.
+    Accounts saved before hashing was added still hold a plaintext "password";
+    these are upgraded to "password_hash" on their first successful login.
+    
+    Args:
+        account (Dict[str, Any]): Account to check against
+        password (str): Password entered by the user
+        
+    Returns:
+        bool: True if the password matches
+    """
+    hashed = hash_password(password)
+    
+    if "password_hash" in account:
+        return hmac.compare_digest(account["password_hash"], hashed)
+    
+    # Legacy plaintext account; one with no password at all never matches
+    if "password" not in account:
+        return False
+    if not hmac.compare_digest(hash_password(account["password"]), hashed):
+        return False
+    
+    account["password_hash"] = hashed
+    account.pop("password", None)
+    mark_accounts_dirty(account["username"])
+    return True
+
 def validate_password(password: str) -> bool:
     """
     Validate password meets all security requirements.
@@ -80,10 +180,20 @@ def validate_password(password: str) -> bool:
     if len(password) > 16 or len(password) < 1:
         return False
     
-    has_lower = any(c.islower() for c in password)
-    has_upper = any(c.isupper() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_symbol = any(c in string.punctuation for c in password)
+    has_lower = has_upper = has_digit = has_symbol = False
+    
+    # Single pass over the password, stopping once every class is found
+    for c in password:
+        if c in _LOWER:
+            has_lower = True
+        elif c in _UPPER:
+            has_upper = True
+        elif c in _DIGITS:
+            has_digit = True
+        elif c in _SYMBOLS:
+            has_symbol = True
+        if has_lower and has_upper and has_digit and has_symbol:
+            break
     
     return has_lower and has_upper and has_digit and has_symbol
 
@@ -94,26 +204,13 @@ def generate_password() -> str:
     Returns:
         str: Generated secure password (12 characters)
     """
-    lower = string.ascii_lowercase      # a-z
-    upper = string.ascii_uppercase      # A-Z
-    digits = string.digits             # 0-9
-    symbols = "!@#$%^&*"              # Safe symbols (avoiding problematic ones)
-    
-    # Ensure at least one of each required character type
-    password = [
-        random.choice(lower),
-        random.choice(upper),
-        random.choice(digits),
-        random.choice(symbols)
-    ]
-    
-    # Add 8 more random characters from all allowed types
-    all_chars = lower + upper + digits + symbols
-    for _ in range(8):
-        password.append(random.choice(all_chars))
+    # Ensure at least one of each required character type,
+    # then add 8 more random characters from all allowed types
+    password = [_PW_RNG.choice(chars) for chars in _PW_REQUIRED]
+    password += _PW_RNG.choices(_PW_POOL, k=8)
     
     # Shuffle to avoid predictable pattern
-    random.shuffle(password)
+    _PW_RNG.shuffle(password)
     return ''.join(password)
 
 def handle_max_attempts(process: str, accounts: Dict[str, Dict[str, Any]], 
@@ -124,7 +221,7 @@ def handle_max_attempts(process: str, accounts: Dict[str, Dict[str, Any]],
     Args:
         process (str): Either "login" or "registration" 
         accounts (Dict[str, Dict[str, Any]]): All user accounts
-        accounts_file (pathlib.Path): Path to accounts JSON file
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
         current_user (Dict[str, Any]): Current user account
         
     Returns:
@@ -151,7 +248,7 @@ def login_user(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path,
     
     Args:
         accounts (Dict[str, Dict[str, Any]]): All user accounts
-        accounts_file (pathlib.Path): Path to accounts JSON file
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
         current_user (Dict[str, Any]): Current user account
         
     Returns:
@@ -165,7 +262,8 @@ def login_user(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path,
     # Step 1: Username validation (up to 5 attempts)
     while username_attempts < 5:
         username = input("Enter username: ").strip()
-        if username in accounts:
+        account = accounts.get(username)
+        if account is not None:
             break  # Valid username found
         print("Username not found. Please try again.")
         username_attempts += 1
@@ -176,19 +274,25 @@ def login_user(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path,
     # Step 2: Password validation (up to 5 attempts)  
     while password_attempts < 5:
         password = input("Enter password: ").strip()
-        if accounts[username]["password"] == password:
+        if check_password(account, password):
             # Login successful!
+            _fail_counts.pop(username, None)
             
             # Step 3: Transfer guest session data if applicable
             if current_user["username"] == "guest":
-                accounts[username]["session_wins"] += current_user["session_wins"]
-                accounts[username]["session_losses"] += current_user["session_losses"]
-                accounts[username]["session_plays"] += current_user["session_plays"]
+                account["session_wins"] += current_user["session_wins"]
+                account["session_losses"] += current_user["session_losses"]
+                account["session_plays"] += current_user["session_plays"]
             
-            current_user = accounts[username]
+            current_user = account
             print(f"\nLogin successful! Welcome back, {current_user['name']}!")
             return True, current_user
             
+        # Back off exponentially on repeated failures for this username
+        failures = _fail_counts.get(username, 0)
+        _fail_counts[username] = failures + 1
+        time.sleep(min(2 ** failures, _MAX_BACKOFF_SECONDS))
+        
         print("Incorrect password. Please try again.")
         password_attempts += 1
     else:
@@ -202,14 +306,12 @@ def register_user(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Pa
     
     Args:
         accounts (Dict[str, Dict[str, Any]]): All user accounts
-        accounts_file (pathlib.Path): Path to accounts JSON file  
+        accounts_file (pathlib.Path): Path to accounts NDJSON file  
         current_user (Dict[str, Any]): Current user account
         
     Returns:
         Tuple[bool, Dict[str, Any]]: (Registration success status, New user account)
     """
-    from storage import save_accounts  # Import here to avoid circular import
-    
     display_register_header()
     
     username_attempts = 0
@@ -265,9 +367,9 @@ def register_user(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Pa
         new_account["session_losses"] = current_user["session_losses"]
         new_account["session_plays"] = current_user["session_plays"]
     
-    # Step 6: Save the new account
+    # Step 6: Add the new account (written to file on logout/exit)
     accounts[username] = new_account
-    save_accounts(accounts, accounts_file)
+    mark_accounts_dirty(username)
     
     print(f"\nRegistration successful! Welcome, {name}!")
     return True, new_account
@@ -280,19 +382,17 @@ def logout_user(current_user: Dict[str, Any], accounts: Dict[str, Dict[str, Any]
     Args:
         current_user (Dict[str, Any]): Current logged-in user
         accounts (Dict[str, Dict[str, Any]]): All user accounts
-        accounts_file (pathlib.Path): Path to accounts JSON file
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
         
     Returns:
         Dict[str, Any]: New guest account
     """
-    from storage import save_accounts  # Import here to avoid circular import
-    
     if current_user["username"] != "guest":
         # Add session statistics to permanent totals
         add_session_to_totals(current_user)
         
         # Save updated account data
-        save_accounts(accounts, accounts_file)
+        flush_accounts(accounts, accounts_file)
         
         print(f"\nGoodbye, {current_user['name']}!")
         print("Your progress has been saved.")
@@ -311,10 +411,17 @@ def get_account_summary(account: Dict[str, Any]) -> str:
     Returns:
         str: Formatted account summary
     """
+    # The key holds every value shown, so a stats change is a new entry
+    key = (account["name"], account["plays"], account["wins"], account["losses"],
+           account["session_plays"], account["session_wins"])
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        return summary
+    
     total_games = account["plays"]
     win_rate = (account["wins"] / total_games * 100) if total_games > 0 else 0
     
-    return f"""
+    summary = f"""
 Account Summary for {account['name']}:
 - Total Games: {total_games}
 - Total Wins: {account['wins']}
@@ -322,4 +429,6 @@ Account Summary for {account['name']}:
 - Win Rate: {win_rate:.1f}%
 - Current Session: {account['session_plays']} games, {account['session_wins']} wins
 """
+    _summary_cache[key] = summary
+    return summary
 
@@ -1,4 +1,11 @@
-from typing import Dict, Any, List
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Tuple
+
+if TYPE_CHECKING:
+    from game_logic import GameSession  # game_logic imports display
+
+# Valid inputs for the menu prompt
+_MENU_CHOICES = frozenset({"1", "2", "3", "4"})
 
 def display_welcome() -> None:
     """Display welcome message when game starts."""
@@ -53,20 +60,15 @@ def get_menu_choice() -> str:
     """
     while True:
         choice = input("\nEnter your choice: ").strip()
-        if choice in ["1", "2", "3", "4"]:
+        if choice in _MENU_CHOICES:
             return choice
         print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
-def get_hangman_stages() -> List[str]:
-    """
-    Get ASCII art for hangman stages - visual representation of game progress.
-    
-    Returns:
-        List[str]: List of hangman ASCII art stages (0=empty gallows, 6=complete hangman)
+# ASCII art for hangman stages (0=empty gallows, 6=complete hangman).
+# Built once at import; callers only index into it.
+_HANGMAN_STAGES: Tuple[str, ...] = (
+    # Stage 0: Empty gallows
     """
-    return [
-        # Stage 0: Empty gallows
-        """
    +---+
    |   |
        |
@@ -75,8 +77,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 1: Head appears
-        """
+    # Stage 1: Head appears
+    """
    +---+
    |   |
    O   |
@@ -85,8 +87,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 2: Body appears  
-        """
+    # Stage 2: Body appears  
+    """
    +---+
    |   |
    O   |
@@ -95,8 +97,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 3: Left arm appears
-        """
+    # Stage 3: Left arm appears
+    """
    +---+
    |   |
    O   |
@@ -105,8 +107,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 4: Right arm appears
-        """
+    # Stage 4: Right arm appears
+    """
    +---+
    |   |
    O   |
@@ -115,8 +117,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 5: Left leg appears
-        """
+    # Stage 5: Left leg appears
+    """
    +---+
    |   |
    O   |
@@ -125,8 +127,8 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """,
-        # Stage 6: Right leg appears - GAME OVER!
-        """
+    # Stage 6: Right leg appears - GAME OVER!
+    """
    +---+
    |   |
    O   |
@@ -135,36 +137,51 @@ def get_hangman_stages() -> List[str]:
        |
 =========
 """
-    ]
+)
+
+def get_hangman_stages() -> Tuple[str, ...]:
+    """
+    Get ASCII art for hangman stages - visual representation of game progress.
+    
+    Returns:
+        Tuple[str, ...]: Hangman ASCII art stages (0=empty gallows, 6=complete hangman)
+    """
+    return _HANGMAN_STAGES
 
-def display_game_state(game_session: Dict[str, Any], hangman_stages: List[str]) -> None:
+def display_game_state(game_session: "GameSession", hangman_stages: Tuple[str, ...]) -> None:
     """
     Display the current state of the hangman game.
     
     Args:
-        game_session (Dict[str, Any]): Current game session data
-        hangman_stages (List[str]): ASCII art stages for hangman
+        game_session (GameSession): Current game session data
+        hangman_stages (Tuple[str, ...]): ASCII art stages for hangman
     """
-    print(hangman_stages[6 - game_session["lives"]])
-    print(f"Word: {get_display_word(game_session)}")
-    print(f"Lives remaining: {game_session['lives']}")
+    lives = game_session.lives
+    
+    # Build the whole frame first so it goes out in a single write
+    parts = [
+        hangman_stages[6 - lives],
+        f"Word: {get_display_word(game_session)}",
+        f"Lives remaining: {lives}"
+    ]
+    if game_session.sorted_guesses:
+        parts.append(f"Guessed letters: {', '.join(game_session.sorted_guesses)}")
     
-    if game_session["guessed_letters"]:
-        print(f"Guessed letters: {', '.join(sorted(game_session['guessed_letters']))}")
+    parts.append("")  # Trailing newline
+    sys.stdout.write("\n".join(parts))
 
-def get_display_word(game_session: Dict[str, Any]) -> str:
+def get_display_word(game_session: "GameSession") -> str:
     """
     Get the word with unguessed letters as underscores.
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         
     Returns:
         str: Display word with underscores for unguessed letters (e.g., "P Y _ H O _")
     """
-    word = game_session["word"]
-    correct_guesses = game_session["correct_guesses"]
-    return " ".join([letter if letter in correct_guesses else "_" for letter in word])
+    # make_guess reveals letters into the buffer as they are guessed
+    return " ".join(game_session.display_buffer)
 
 def get_letter_guess() -> str:
     """
@@ -175,24 +192,23 @@ def get_letter_guess() -> str:
     """
     while True:
         guess = input("\nEnter a letter: ").strip().upper()
-        if len(guess) == 1 and guess.isalpha():
+        if len(guess) == 1 and 'A' <= guess <= 'Z':  # ASCII letters only, like the word list
             return guess
         print("Please enter a single letter.")
 
-def display_game_result(game_session: Dict[str, Any], word: str, hangman_stages: List[str]) -> None:
+def display_game_result(game_session: "GameSession", word: str, hangman_stages: Tuple[str, ...]) -> None:
     """
     Display the final game result (win or loss).
     
     Args:
-        game_session (Dict[str, Any]): Completed game session
+        game_session (GameSession): Completed game session
         word (str): The word that was being guessed
-        hangman_stages (List[str]): ASCII art stages for hangman
+        hangman_stages (Tuple[str, ...]): ASCII art stages for hangman
     """
     # Show final hangman state
-    print(hangman_stages[6 - game_session["lives"]])
-    print(f"The word was: {word}")
+    sys.stdout.write(f"{hangman_stages[6 - game_session.lives]}\nThe word was: {word}\n")
     
-    if game_session["is_won"]:
+    if game_session.is_won:
         print("🎉 Congratulations! You won! 🎉")
     else:
         print("💀 Game over! Better luck next time! 💀")
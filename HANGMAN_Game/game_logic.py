@@ -1,84 +1,124 @@
+import bisect
 import random
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet, List, Set
 from retrieve_word_fn import retrieve_word
 from display import (
     display_game_header, get_hangman_stages, display_game_state, 
     get_letter_guess, display_game_result, display_session_stats
 )
 
-def create_game_session(word: str) -> Dict[str, Any]:
+# Dedicated generator for word selection (can be seeded for repeatable games)
+_RNG = random.Random()
+
+# Fallback words if API is unavailable
+_FALLBACK_WORDS = (
+    "PYTHON", "PROGRAMMING", "COMPUTER", "KEYBOARD", "MONITOR", 
+    "SOFTWARE", "HARDWARE", "INTERNET", "WEBSITE", "DATABASE",
+    "FUNCTION", "VARIABLE", "ALGORITHM", "CODING", "DEBUGGING"
+)
+
+@dataclass(slots=True)
+class GameSession:
+    """
+    State of a single hangman game.
+    Uses slots so the per-guess field access skips dictionary hashing.
+    """
+    word: str                                 # The word to guess (uppercase)
+    word_letters: FrozenSet[str]              # Distinct letters needed to win
+    unique_count: int                         # Number of distinct letters
+    letter_positions: Dict[str, List[int]]    # Letter -> indices in word
+    display_buffer: List[str]                 # Word as currently revealed
+    guessed_letters: Set[str] = field(default_factory=set)  # All letters guessed so far
+    sorted_guesses: List[str] = field(default_factory=list) # Same letters, kept in alphabetical order
+    correct_guesses: Set[str] = field(default_factory=set)  # Only correct letters
+    wrong_guesses: Set[str] = field(default_factory=set)    # Only wrong letters
+    lives: int = 6                # Start with 6 lives (standard hangman)
+    is_complete: bool = False     # Game not finished yet
+    is_won: bool = False          # Haven't won yet
+
+def create_game_session(word: str) -> GameSession:
     """
-    Create a new game session dictionary with initial game state.
+    Create a new game session with initial game state.
     
     Args:
         word (str): The word to guess
         
     Returns:
-        Dict[str, Any]: Game session dictionary with all game state variables
-    """
-    return {
-        "word": word.upper(),
-        "guessed_letters": [],    # All letters guessed so far
-        "correct_guesses": [],    # Only correct letters
-        "wrong_guesses": [],      # Only wrong letters
-        "lives": 6,              # Start with 6 lives (standard hangman)
-        "is_complete": False,    # Game not finished yet
-        "is_won": False         # Haven't won yet
-    }
+        GameSession: Game session holding all game state variables
+    """
+    word = word.upper()
+    word_letters = frozenset(word)
+    
+    # Index where each letter appears so correct guesses can be revealed directly
+    letter_positions: Dict[str, List[int]] = {}
+    for i, char in enumerate(word):
+        letter_positions.setdefault(char, []).append(i)
+    
+    return GameSession(
+        word=word,
+        word_letters=word_letters,
+        unique_count=len(word_letters),
+        letter_positions=letter_positions,
+        display_buffer=["_"] * len(word)
+    )
 
-def make_guess(game_session: Dict[str, Any], letter: str) -> bool:
+def make_guess(game_session: GameSession, letter: str) -> bool:
     """
     Process a letter guess and update the game state.
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         letter (str): The guessed letter
         
     Returns:
         bool: True if guess was correct, False if wrong or already guessed
     """
     letter = letter.upper()
-    word = game_session["word"]
     
     # Check if letter already guessed
-    if letter in game_session["guessed_letters"]:
+    if letter in game_session.guessed_letters:
         return False
     
-    # Add to guessed letters list
-    game_session["guessed_letters"].append(letter)
+    # Add to guessed letters (set for lookups, sorted list for display)
+    game_session.guessed_letters.add(letter)
+    bisect.insort(game_session.sorted_guesses, letter)
     
-    if letter in word:
+    if letter in game_session.word_letters:
         # Correct guess!
-        game_session["correct_guesses"].append(letter)
+        game_session.correct_guesses.add(letter)
+        display_buffer = game_session.display_buffer
+        for i in game_session.letter_positions[letter]:
+            display_buffer[i] = letter
         
         # Check if word is complete (all letters guessed)
-        if all(char in game_session["correct_guesses"] for char in word):
-            game_session["is_complete"] = True
-            game_session["is_won"] = True
+        if game_session.correct_guesses >= game_session.word_letters:
+            game_session.is_complete = True
+            game_session.is_won = True
         return True
     else:
         # Wrong guess!
-        game_session["wrong_guesses"].append(letter)
-        game_session["lives"] -= 1
+        game_session.wrong_guesses.add(letter)
+        game_session.lives -= 1
         
         # Check if game over (no lives left)
-        if game_session["lives"] <= 0:
-            game_session["is_complete"] = True
-            game_session["is_won"] = False
+        if game_session.lives <= 0:
+            game_session.is_complete = True
+            game_session.is_won = False
         return False
 
-def is_letter_already_guessed(game_session: Dict[str, Any], letter: str) -> bool:
+def is_letter_already_guessed(game_session: GameSession, letter: str) -> bool:
     """
     Check if a letter has already been guessed.
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         letter (str): Letter to check
         
     Returns:
         bool: True if letter was already guessed
     """
-    return letter.upper() in game_session["guessed_letters"]
+    return letter.upper() in game_session.guessed_letters
 
 def get_random_word() -> str:
     """
@@ -88,18 +128,12 @@ def get_random_word() -> str:
         str: A random word for the hangman game
     """
     try:
-        word = retrieve_word(random.randint(4, 10))
+        word = retrieve_word(_RNG.randint(4, 10))
         print(f"Retrieved word from API: {len(word)} letters")
         return word
     except Exception as e:
         print(f"Error retrieving word from API: {e}")
-        # Fallback words if API is unavailable
-        fallback_words = [
-            "PYTHON", "PROGRAMMING", "COMPUTER", "KEYBOARD", "MONITOR", 
-            "SOFTWARE", "HARDWARE", "INTERNET", "WEBSITE", "DATABASE",
-            "FUNCTION", "VARIABLE", "ALGORITHM", "CODING", "DEBUGGING"
-        ]
-        word = random.choice(fallback_words)
+        word = _RNG.choice(_FALLBACK_WORDS)
         print("Using fallback word.")
         return word
 
@@ -123,7 +157,7 @@ def play_game(current_user: Dict[str, Any]) -> None:
     print("Good luck!\n")
     
     # Step 3: Main game loop - continue until game is complete
-    while not game_session["is_complete"]:
+    while not game_session.is_complete:
         # Display current game state
         display_game_state(game_session, hangman_stages)
         
@@ -145,7 +179,7 @@ def play_game(current_user: Dict[str, Any]) -> None:
     display_game_result(game_session, word, hangman_stages)
     
     # Step 5: Update user statistics
-    if game_session["is_won"]:
+    if game_session.is_won:
         current_user["session_wins"] += 1
     else:
         current_user["session_losses"] += 1
@@ -155,44 +189,44 @@ def play_game(current_user: Dict[str, Any]) -> None:
     # Step 6: Display session statistics
     display_session_stats(current_user)
 
-def is_game_complete(game_session: Dict[str, Any]) -> bool:
+def is_game_complete(game_session: GameSession) -> bool:
     """
     Check if the game is complete (won or lost).
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         
     Returns:
         bool: True if game is complete
     """
-    return game_session["is_complete"]
+    return game_session.is_complete
 
-def is_game_won(game_session: Dict[str, Any]) -> bool:
+def is_game_won(game_session: GameSession) -> bool:
     """
     Check if the game was won.
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         
     Returns:
         bool: True if game was won
     """
-    return game_session["is_won"]
+    return game_session.is_won
 
-def get_game_stats(game_session: Dict[str, Any]) -> Dict[str, Any]:
+def get_game_stats(game_session: GameSession) -> Dict[str, Any]:
     """
     Get statistics about the current game session.
     
     Args:
-        game_session (Dict[str, Any]): Current game session
+        game_session (GameSession): Current game session
         
     Returns:
         Dict[str, Any]: Game statistics
     """
     return {
-        "total_guesses": len(game_session["guessed_letters"]),
-        "correct_guesses": len(game_session["correct_guesses"]),
-        "wrong_guesses": len(game_session["wrong_guesses"]),
-        "lives_remaining": game_session["lives"],
-        "word_completion": len(game_session["correct_guesses"]) / len(set(game_session["word"])) * 100
+        "total_guesses": len(game_session.guessed_letters),
+        "correct_guesses": len(game_session.correct_guesses),
+        "wrong_guesses": len(game_session.wrong_guesses),
+        "lives_remaining": game_session.lives,
+        "word_completion": len(game_session.correct_guesses) / game_session.unique_count * 100
     } 
\ No newline at end of file
@@ -4,6 +4,7 @@ This is the entry point of the Hangman game application.
 It coordinates all other modules and handles the main game loop.
 """
 
+import logging
 from typing import Dict, Any
 
 # Import all the modules we created
@@ -11,9 +12,9 @@ from display import display_welcome, display_main_menu, get_menu_choice, get_use
 from game_logic import play_game
 from accounts import (
     create_guest_account, login_user, register_user, logout_user, 
-    add_session_to_totals
+    add_session_to_totals, flush_accounts
 )
-from storage import setup_accounts_file, load_accounts, save_accounts
+from storage import setup_accounts_file, load_accounts
 
 
 def exit_game(current_user: Dict[str, Any], accounts: Dict[str, Dict[str, Any]], 
@@ -24,12 +25,12 @@ def exit_game(current_user: Dict[str, Any], accounts: Dict[str, Dict[str, Any]],
     Args:
         current_user (Dict[str, Any]): Current user account
         accounts (Dict[str, Dict[str, Any]]): All user accounts
-        accounts_file: Path to accounts JSON file
+        accounts_file: Path to accounts NDJSON file
     """
     if current_user["username"] != "guest":
         # Save registered user's progress before exiting
         add_session_to_totals(current_user)
-        save_accounts(accounts, accounts_file)
+        flush_accounts(accounts, accounts_file)
         print(f"\nGoodbye, {current_user['name']}! Your progress has been saved.")
     else:
         # Guest user - no saving needed
@@ -43,6 +44,9 @@ def main() -> None:
     Main game loop and entry point of the application.
     Coordinates all modules and handles the primary game flow.
     """
+    accounts_file = None
+    accounts: Dict[str, Dict[str, Any]] = {}
+    
     try:
         # Step 1: Initialize file system and load data
         print("Initializing Hangman Game...")
@@ -101,6 +105,12 @@ def main() -> None:
         print("- accounts.py")
         print("- storage.py")
         print("- retrieve_word_fn.py")
+        
+    finally:
+        # Saving is deferred to logout/exit, so write any registrations or
+        # password upgrades that an interrupt or error would otherwise lose
+        if accounts_file is not None:
+            flush_accounts(accounts, accounts_file)
 
 
 def run_game() -> None:
@@ -113,4 +123,6 @@ def run_game() -> None:
 
 if __name__ == "__main__":
     # Program entry point - this runs when you execute: python main.py
+    # Show storage messages as plain lines, like the rest of the game output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
\ No newline at end of file
@@ -1,34 +1,450 @@
+import atexit
+import hashlib
 import json
+import logging
+import mmap
+import os
 import pathlib
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
+
+try:
+    import orjson  # Optional C-accelerated JSON parser/encoder
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # Optional, used to compress backups
+except ImportError:
+    zstandard = None
+
+try:
+    import xxhash  # Optional fast hash for spotting unchanged saves
+except ImportError:
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+# First bytes of every zstd frame, used to recognise compressed files
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Where each account's line sits in the accounts file, as username ->
+# (byte offset, line length without newline). Built by load_accounts and
+# kept current by every save, so single records can be rewritten in place.
+# Only trusted while the file is _indexed_file and is exactly _indexed_size
+# bytes long; anything else falls back to a full rewrite.
+_record_index: Dict[str, Tuple[int, int]] = {}
+_indexed_file: Optional[pathlib.Path] = None
+_indexed_size = 0
+# Digest of the bytes last written by a full save of _indexed_file, cleared
+# by any other write; a full save that would write the same bytes is skipped
+_last_digest: Optional[bytes] = None
+
+# Accounts file kept open between operations (see _ensure_open), so updates
+# are positional reads/writes on a held descriptor rather than a fresh open()
+_fd = -1
+_fd_file: Optional[pathlib.Path] = None
+
+# Accounts are stored one JSON record per line (NDJSON)
+_ACCOUNTS_FILE = "accounts.ndjson"
+# Older versions kept a single JSON array here; migrated on first setup
+_LEGACY_ACCOUNTS_FILE = "accounts.json"
+# The legacy file is renamed to this once migrated (it may hold plaintext passwords)
+_MIGRATED_ACCOUNTS_FILE = "accounts.json.migrated"
+# Permissions for every accounts file we create: they hold password hashes
+_FILE_MODE = 0o600
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to catch the latter.
+    
+    Args:
+        data (bytes): UTF-8 encoded JSON
+        
+    Returns:
+        Any: Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _ensure_open(accounts_file: pathlib.Path) -> int:
+    """
+    Get the held descriptor for the accounts file, opening it (and creating
+    the file if needed) on first use.
+    
+    Args:
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        
+    Returns:
+        int: Read/write file descriptor for accounts_file
+    """
+    global _fd, _fd_file
+    
+    if _fd >= 0 and _fd_file == accounts_file:
+        return _fd
+    
+    _close_fd()
+    _fd = os.open(accounts_file, os.O_RDWR | os.O_CREAT, _FILE_MODE)
+    _fd_file = accounts_file
+    return _fd
+
+def _close_fd() -> None:
+    """
+    Close the held accounts file descriptor, if any. Must be called whenever
+    the file is replaced or renamed, since the descriptor still points at
+    the old file.
+    """
+    global _fd, _fd_file
+    
+    if _fd >= 0:
+        os.close(_fd)
+    _fd = -1
+    _fd_file = None
+
+atexit.register(_close_fd)
+
+def _write_atomic(file_path: pathlib.Path, data: bytes) -> None:
+    """
+    Write a file atomically: the data goes to a sibling temp file that then
+    replaces the target, so a crash mid-write never leaves a truncated file.
+    
+    Args:
+        file_path (pathlib.Path): Destination file
+        data (bytes): Complete file contents
+    """
+    tmp_file = file_path.with_name(file_path.name + ".tmp")
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _FILE_MODE)
+        with open(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, file_path)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    
+    if file_path == _fd_file:
+        _close_fd()  # Held descriptor is for the replaced file
+
+# Files larger than this are parsed straight from a memory map
+_MMAP_THRESHOLD = 1024 * 1024
+
+def _read_json(file_path: pathlib.Path, size: Optional[int] = None) -> Any:
+    """
+    Read and parse a JSON file.
+    Large files are memory-mapped and parsed in place when orjson is installed,
+    so the file contents are never copied into a separate bytes object.
+    
+    Args:
+        file_path (pathlib.Path): Path to JSON file
+        size (Optional[int]): File size if the caller already has it from stat()
+        
+    Returns:
+        Any: Parsed JSON data
+    """
+    if orjson is None:
+        return _loads(file_path.read_bytes())
+    
+    if size is None:
+        size = file_path.stat().st_size
+    if size > _MMAP_THRESHOLD:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    return _loads(file_path.read_bytes())
+
+def _iter_slots(file_path: pathlib.Path, size: Optional[int] = None, 
+                fd: Optional[int] = None) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Parse an NDJSON file one record at a time, so memory use is bounded by
+    the largest record rather than the whole file. Large files are
+    memory-mapped and each line is parsed in place when orjson is installed.
+    zstd-compressed files (backups) are decompressed transparently.
+    
+    Args:
+        file_path (pathlib.Path): Path to NDJSON file
+        size (Optional[int]): File size if the caller already has it from stat()
+        fd (Optional[int]): Already open descriptor for file_path to read from
+        
+    Yields:
+        Tuple[int, int, Dict[str, Any]]: (Byte offset of the line, line length
+        without the newline, parsed record) per non-empty line. The offset is
+        -1 for compressed files, where it has no meaning on disk.
+    """
+    if size is None:
+        size = file_path.stat().st_size if fd is None else os.fstat(fd).st_size
+    
+    with open(file_path, 'rb') if fd is None else open(fd, 'rb', closefd=False) as f:
+        f.seek(0)  # A held descriptor may be positioned anywhere
+        if zstandard is not None and f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC:
+            f.seek(0)
+            data = zstandard.ZstdDecompressor().decompress(f.read())
+            for line in data.splitlines():
+                if line.strip():
+                    yield -1, len(line), _loads(line)
+            return
+        f.seek(0)
+        
+        if orjson is not None and size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    start = 0
+                    while start < size:
+                        end = mm.find(b"\n", start)
+                        if end == -1:
+                            end = size
+                        # Skip blank and whitespace-only lines, as the buffered path does
+                        if mm[start:end].strip():
+                            yield start, end - start, orjson.loads(view[start:end])
+                        start = end + 1
+            return
+        
+        offset = 0
+        for line in f:
+            if line.strip():
+                length = len(line) - 1 if line.endswith(b"\n") else len(line)
+                yield offset, length, _loads(line)
+            offset += len(line)
+
+def _iter_accounts(file_path: pathlib.Path, size: Optional[int] = None, 
+                   fd: Optional[int] = None) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Parse an accounts file one record at a time (see _iter_slots), checking
+    each record is an account: a JSON object with a string "username".
+    Every reader of the accounts file goes through this, so they all agree
+    on what a corrupt file is.
+    
+    Args:
+        file_path (pathlib.Path): Path to NDJSON file
+        size (Optional[int]): File size if the caller already has it from stat()
+        fd (Optional[int]): Already open descriptor for file_path to read from
+        
+    Yields:
+        Tuple[int, int, Dict[str, Any]]: (Byte offset, line length, account) per non-empty line
+        
+    Raises:
+        ValueError: If a line is not valid JSON or UTF-8 (json.JSONDecodeError and
+        UnicodeDecodeError are both ValueErrors) or does not hold an account
+    """
+    for number, (offset, length, record) in enumerate(_iter_slots(file_path, size, fd), 1):
+        if not isinstance(record, dict) or not isinstance(record.get("username"), str):
+            raise ValueError(f"Record {number} in {file_path} is not an account")
+        yield offset, length, record
+
+def _iter_records(file_path: pathlib.Path, size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parse an accounts file one account at a time (see _iter_accounts).
+    
+    Args:
+        file_path (pathlib.Path): Path to NDJSON file
+        size (Optional[int]): File size if the caller already has it from stat()
+        
+    Yields:
+        Dict[str, Any]: One account per non-empty line
+    """
+    for _, _, record in _iter_accounts(file_path, size):
+        yield record
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact single-line JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data (Any): JSON-serializable data
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def _encode_accounts(accounts: Dict[str, Dict[str, Any]]) -> Tuple[bytes, Dict[str, Tuple[int, int]]]:
+    """
+    Encode all accounts as NDJSON, one record per line.
+    
+    Args:
+        accounts (Dict[str, Dict[str, Any]]): Dictionary of all accounts
+        
+    Returns:
+        Tuple[bytes, Dict[str, Tuple[int, int]]]: (File contents for the accounts
+        file, record index of username -> (offset, length) within them)
+    """
+    lines = []
+    index: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for username, account in accounts.items():
+        line = _dumps(account)
+        index[username] = (offset, len(line))
+        lines.append(line)
+        offset += len(line) + 1
+    
+    lines.append(b"")  # Trailing newline after the last record
+    return b"\n".join(lines), index
+
+def _digest(payload: bytes) -> bytes:
+    """
+    Hash file contents to tell whether a save would change anything.
+    Uses xxhash when it is installed, otherwise BLAKE2b.
+    
+    Args:
+        payload (bytes): File contents
+        
+    Returns:
+        bytes: Digest of payload
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(payload)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _set_record_index(accounts_file: Optional[pathlib.Path], index: Dict[str, Tuple[int, int]], 
+                      size: int, digest: Optional[bytes] = None) -> None:
+    """
+    Replace the record index after the accounts file was read or rewritten.
+    
+    Args:
+        accounts_file (Optional[pathlib.Path]): File the index describes (None to drop it)
+        index (Dict[str, Tuple[int, int]]): username -> (offset, length) of each record
+        size (int): File size the index is valid for
+        digest (Optional[bytes]): Digest of the file contents, if just written in full
+    """
+    global _record_index, _indexed_file, _indexed_size, _last_digest
+    _record_index = index
+    _indexed_file = accounts_file
+    _indexed_size = size
+    _last_digest = digest
+
+def _update_records(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path, 
+                    dirty: Set[str]) -> bool:
+    """
+    Write only the changed accounts, using the record index.
+    A changed record that still fits in its old line is overwritten in place,
+    padded with spaces (valid JSON whitespace). New accounts are appended.
+    
+    Args:
+        accounts (Dict[str, Dict[str, Any]]): Dictionary of all accounts
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        dirty (Set[str]): Usernames changed since the last save
+        
+    Returns:
+        bool: True if the changes were written, False if a full rewrite is needed
+    """
+    global _indexed_size, _last_digest
+    
+    if accounts_file != _indexed_file:
+        return False
+    
+    overwrites = []
+    appends = []
+    for username in dirty:
+        account = accounts.get(username)
+        if account is None:
+            return False  # Removed account - its line must go
+        
+        line = _dumps(account)
+        slot = _record_index.get(username)
+        if slot is None:
+            appends.append((username, line))
+        elif len(line) <= slot[1]:
+            overwrites.append((slot[0], line.ljust(slot[1])))
+        else:
+            return False  # Grew past its line
+    
+    fd = _ensure_open(accounts_file)
+    if os.fstat(fd).st_size != _indexed_size:
+        return False  # File changed behind our back
+    
+    for offset, line in overwrites:
+        os.pwrite(fd, line, offset)
+    
+    offset = _indexed_size
+    for username, line in appends:
+        _record_index[username] = (offset, len(line))
+        offset += os.pwrite(fd, line + b"\n", offset)
+    _indexed_size = offset
+    _last_digest = None
+    
+    return True
+
+def _migrate_legacy_accounts(legacy_file: pathlib.Path, accounts_file: pathlib.Path) -> None:
+    """
+    Convert a JSON-array accounts file from older versions to NDJSON.
+    Once migrated, the legacy file is renamed to accounts.json.migrated and
+    made owner-only, since older versions stored plaintext passwords in it.
+    A legacy file that cannot be parsed is left in place.
+    
+    Args:
+        legacy_file (pathlib.Path): Path to old accounts.json file
+        accounts_file (pathlib.Path): Path to new NDJSON accounts file
+    """
+    try:
+        accounts_data = _read_json(legacy_file)
+        accounts = {account_data["username"]: account_data for account_data in accounts_data}
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+        logger.error("Could not migrate %s: %s", legacy_file, e)
+        _write_atomic(accounts_file, _encode_accounts({})[0])
+        return
+    
+    logger.info("Migrating %d accounts from %s to %s", len(accounts), legacy_file, accounts_file)
+    _write_atomic(accounts_file, _encode_accounts(accounts)[0])
+    
+    migrated_file = legacy_file.with_name(_MIGRATED_ACCOUNTS_FILE)
+    try:
+        legacy_file.rename(migrated_file)
+        os.chmod(migrated_file, _FILE_MODE)
+        logger.info("Moved %s aside as %s", legacy_file, migrated_file)
+    except OSError as e:
+        # The accounts are already migrated; only the old copy is left behind
+        logger.warning("Could not move %s aside: %s", legacy_file, e)
 
 def setup_accounts_file() -> pathlib.Path:
     """
-    Create accounts.json file in the main directory if it doesn't exist.
-    Sets up the basic file structure for account storage.
+    Create accounts.ndjson file in the main directory if it doesn't exist.
+    Accounts from an older accounts.json file are migrated into it.
     
     Returns:
-        pathlib.Path: Path to the accounts.json file
+        pathlib.Path: Path to the accounts.ndjson file
     """
-    accounts_file: pathlib.Path = pathlib.Path("accounts.json")
+    accounts_file: pathlib.Path = pathlib.Path(_ACCOUNTS_FILE)
     
     try:
-        if not accounts_file.exists():
-            # Create empty JSON array file
-            accounts_file.write_text("[]")
-            print("Created accounts.json file in the main directory.")
-    except (OSError, IOError) as e:
-        print(f"Error creating accounts file: {e}")
+        # Create the empty file (no records yet) in one call; EEXIST means
+        # it is already set up, so there is no separate exists() check
+        os.close(os.open(_ACCOUNTS_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, _FILE_MODE))
+    except FileExistsError:
+        return accounts_file
+    except OSError as e:
+        logger.error("Error creating accounts file: %s", e)
+        return accounts_file
+    
+    migrated = False
+    try:
+        legacy_file = pathlib.Path(_LEGACY_ACCOUNTS_FILE)
+        if legacy_file.exists():
+            _migrate_legacy_accounts(legacy_file, accounts_file)
+        else:
+            logger.info("Created %s file in the main directory.", _ACCOUNTS_FILE)
+        migrated = True
+    except OSError as e:
+        logger.error("Error creating accounts file: %s", e)
+    finally:
+        # On any failure, interrupts included, remove the empty placeholder;
+        # otherwise the next start would find it and never retry the migration
+        if not migrated:
+            accounts_file.unlink(missing_ok=True)
     
     return accounts_file
 
 def load_accounts(accounts_file: pathlib.Path) -> Dict[str, Dict[str, Any]]:
     """
-    Load all user accounts from JSON file into memory.
-    Converts JSON array format to dictionary for easy lookup by username.
+    Load all user accounts from NDJSON file into memory.
+    Builds a dictionary for easy lookup by username, one record at a time.
     
     Args:
-        accounts_file (pathlib.Path): Path to accounts JSON file
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
         
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary of accounts keyed by username
@@ -36,65 +452,191 @@ def load_accounts(accounts_file: pathlib.Path) -> Dict[str, Dict[str, Any]]:
     accounts: Dict[str, Dict[str, Any]] = {}
     
     try:
-        if accounts_file.exists():
-            with open(accounts_file, 'r') as f:
-                accounts_data = json.load(f)
-                
-                # Convert JSON array to dictionary for easy username lookup
-                for account_data in accounts_data:
-                    username = account_data["username"]
-                    accounts[username] = account_data
-                    
-            print(f"Loaded {len(accounts)} accounts from {accounts_file}")
-    except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
-        print(f"Error loading accounts: {e}")
-        print("Starting with empty accounts database.")
+        fd = _ensure_open(accounts_file)
+        size = os.fstat(fd).st_size
+        index: Dict[str, Tuple[int, int]] = {}
+        indexable = True
+        
+        # Key records by username as they are parsed, noting where each line sits
+        for offset, length, account_data in _iter_accounts(accounts_file, size, fd):
+            # Each line is parsed on its own, so every record would otherwise
+            # hold its own copies of the field names. Only keys are interned:
+            # the string values are names, usernames and password hashes.
+            account_data = {sys.intern(key): value for key, value in account_data.items()}
+            username = account_data["username"]
+            accounts[username] = account_data
+            index[username] = (offset, length)
+            # Compressed files and a last line with no newline can't be patched
+            if offset < 0 or offset + length == size:
+                indexable = False
+        
+        _set_record_index(accounts_file if indexable else None, index, size)
+        logger.info("Loaded %d accounts from %s", len(accounts), accounts_file)
+    except FileNotFoundError as e:
+        logger.error("Error loading accounts: %s", e)
+        logger.info("Starting with empty accounts database.")
+    except ValueError as e:
+        # This parse already proved the file is bad, so go straight to the
+        # repair step instead of having repair_accounts_file parse it again.
+        # Records read before the bad line are dropped too: the file they
+        # came from is moved aside, so keeping them would let a later save
+        # write out a partial database.
+        logger.error("Error loading accounts: %s", e)
+        accounts = {}
+        try:
+            _replace_corrupted_file(accounts_file, file_found=True)
+        except OSError as repair_error:
+            logger.error("Error repairing accounts file: %s", repair_error)
+        logger.info("Starting with empty accounts database.")
     
     return accounts
 
-def save_accounts(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path) -> None:
+def find_account(accounts_file: pathlib.Path, username: str) -> Optional[Dict[str, Any]]:
     """
-    Save all user accounts to JSON file.
-    Converts dictionary format back to JSON array for storage.
+    Look up a single account without loading the whole file.
+    Scans the NDJSON records in order and stops at the first match, so only
+    one record is held in memory at a time. Use load_accounts instead when
+    more than one account is needed.
     
     Args:
-        accounts (Dict[str, Dict[str, Any]]): Dictionary of all accounts
-        accounts_file (pathlib.Path): Path to accounts JSON file
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        username (str): Username to look for
+        
+    Returns:
+        Optional[Dict[str, Any]]: The account, or None if not found or unreadable
     """
     try:
-        # Convert dictionary back to list format for JSON storage
-        accounts_data = list(accounts.values())
+        for account in _iter_records(accounts_file):
+            if account["username"] == username:
+                return account
+    except (OSError, ValueError) as e:
+        logger.error("Error reading accounts: %s", e)
+    
+    return None
+
+def save_accounts(accounts: Dict[str, Dict[str, Any]], accounts_file: pathlib.Path, 
+                  dirty: Optional[Set[str]] = None, backup: Optional[str] = None) -> bool:
+    """
+    Save user accounts to NDJSON file, one JSON record per line.
+    With no dirty set the whole file is replaced. When the usernames changed
+    since the last load/save are given, only those records are written if
+    possible (see _update_records), falling back to a full rewrite.
+    When a backup name is given the whole file is always rewritten, and the
+    same encoded bytes are written to the backup, so accounts are only
+    serialized once. A full rewrite is skipped if the file already holds
+    exactly those bytes from the last full save.
+    
+    Args:
+        accounts (Dict[str, Dict[str, Any]]): Dictionary of all accounts
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        dirty (Optional[Set[str]]): Usernames changed since the last save
+        backup (Optional[str]): Also write a backup with this name (see backup_accounts)
         
-        with open(accounts_file, 'w') as f:
-            json.dump(accounts_data, f, indent=2)
+    Returns:
+        bool: True if accounts were saved, False otherwise (a failed backup
+        does not fail the save)
+    """
+    try:
+        if backup is not None or dirty is None or not _update_records(accounts, accounts_file, dirty):
+            payload, index = _encode_accounts(accounts)
+            digest = _digest(payload)
+            if accounts_file == _indexed_file and digest == _last_digest:
+                logger.debug("Accounts unchanged, %s not rewritten", accounts_file)
+            else:
+                _write_atomic(accounts_file, payload)
+                _set_record_index(accounts_file, index, len(payload), digest)
             
-        print(f"Accounts saved to {accounts_file}")
-    except (IOError, json.JSONEncodeError) as e:
-        print(f"Error saving accounts: {e}")
+        logger.info("Accounts saved to %s", accounts_file)
+    except (OSError, TypeError, ValueError) as e:
+        _set_record_index(None, {}, 0)  # File state unknown after a failed write
+        logger.error("Error saving accounts: %s", e)
+        return False
+    
+    if backup is not None:
+        _write_backup(payload, backup)
+    return True
 
-def backup_accounts(accounts: Dict[str, Dict[str, Any]], backup_name: str = "backup") -> bool:
+def append_account(accounts_file: pathlib.Path, account: Dict[str, Any]) -> bool:
     """
-    Create a backup copy of the accounts file.
+    Append a single new account to the NDJSON file without rewriting it.
     
     Args:
-        accounts (Dict[str, Dict[str, Any]]): Dictionary of all accounts
-        backup_name (str): Name for the backup file (default: "backup")
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        account (Dict[str, Any]): Account to add (username must not already be stored)
         
     Returns:
-        bool: True if backup was successful, False otherwise
+        bool: True if the account was written, False otherwise
     """
+    global _indexed_size, _last_digest
+    
     try:
-        backup_file = pathlib.Path(f"accounts_{backup_name}.json")
-        accounts_data = list(accounts.values())
+        line = _dumps(account)
+        fd = _ensure_open(accounts_file)
+        offset = os.fstat(fd).st_size
+        os.pwrite(fd, line + b"\n", offset)
+        
+        # Keep the record index in step if it describes this file
+        if accounts_file == _indexed_file and offset == _indexed_size:
+            _record_index[account["username"]] = (offset, len(line))
+            _indexed_size = offset + len(line) + 1
+            _last_digest = None
+        elif accounts_file == _indexed_file:
+            _set_record_index(None, {}, 0)
         
-        with open(backup_file, 'w') as f:
-            json.dump(accounts_data, f, indent=2)
+        logger.info("Account %s saved to %s", account["username"], accounts_file)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.error("Error saving account: %s", e)
+        return False
+
+def _write_backup(payload: bytes, backup_name: str) -> bool:
+    """
+    Write accounts file contents to a backup file.
+    When zstandard is installed the backup is zstd-compressed (.ndjson.zst),
+    which shrinks the repeated field names in every record; load_accounts
+    reads either form.
+    
+    Args:
+        payload (bytes): Accounts file contents
+        backup_name (str): Name for the backup file
+        
+    Returns:
+        bool: True if backup was successful, False otherwise
+    """
+    try:
+        if zstandard is not None:
+            backup_file = pathlib.Path(f"accounts_{backup_name}.ndjson.zst")
+            payload = zstandard.ZstdCompressor(level=1).compress(payload)
+        else:
+            backup_file = pathlib.Path(f"accounts_{backup_name}.ndjson")
+        _write_atomic(backup_file, payload)
             
-        print(f"Backup created: {backup_file}")
+        logger.info("Backup created: %s", backup_file)
         return True
-    except (IOError, json.JSONEncodeError) as e:
-        print(f"Error creating backup: {e}")
+    except OSError as e:
+        logger.error("Error creating backup: %s", e)
+        return False
+
+def backup_accounts(accounts_file: pathlib.Path, backup_name: str = "backup") -> bool:
+    """
+    Create a backup copy of the accounts file as last saved.
+    Prefer save_accounts(..., backup=name) when saving anyway, which writes
+    the backup from the bytes it just encoded.
+    
+    Args:
+        accounts_file (pathlib.Path): Path to accounts NDJSON file
+        backup_name (str): Name for the backup file (default: "backup")
+        
+    Returns:
+        bool: True if backup was successful, False otherwise
+    """
+    try:
+        payload = accounts_file.read_bytes()
+    except OSError as e:
+        logger.error("Error creating backup: %s", e)
         return False
+    
+    return _write_backup(payload, backup_name)
 
 def file_exists(file_path: str) -> bool:
     """
@@ -106,7 +648,7 @@ def file_exists(file_path: str) -> bool:
     Returns:
         bool: True if file exists, False otherwise
     """
-    return pathlib.Path(file_path).exists()
+    return os.path.exists(file_path)
 
 def get_file_size(file_path: str) -> int:
     """
@@ -119,30 +661,31 @@ def get_file_size(file_path: str) -> int:
         int: File size in bytes, -1 if file doesn't exist
     """
     try:
-        return pathlib.Path(file_path).stat().st_size
-    except (FileNotFoundError, OSError):
+        return os.stat(file_path).st_size
+    except OSError:
         return -1
 
 def validate_json_file(file_path: pathlib.Path) -> bool:
     """
-    Validate that a JSON file is properly formatted.
+    Validate that an accounts NDJSON file is properly formatted, every
+    non-empty line holding one account, by the same rule load_accounts uses.
     
     Args:
-        file_path (pathlib.Path): Path to JSON file to validate
+        file_path (pathlib.Path): Path to NDJSON file to validate
         
     Returns:
-        bool: True if JSON is valid, False otherwise
+        bool: True if every record is a valid account, False otherwise
     """
     try:
-        with open(file_path, 'r') as f:
-            json.load(f)
+        for _ in _iter_records(file_path):
+            pass
         return True
-    except (json.JSONDecodeError, FileNotFoundError, IOError):
+    except (ValueError, OSError):
         return False
 
 def repair_accounts_file(accounts_file: pathlib.Path) -> bool:
     """
-    Attempt to repair a corrupted accounts.json file.
+    Attempt to repair a corrupted accounts.ndjson file.
     Creates a new empty file if repair is not possible.
     
     Args:
@@ -152,27 +695,48 @@ def repair_accounts_file(accounts_file: pathlib.Path) -> bool:
         bool: True if repair was successful, False if new file was created
     """
     try:
-        # Try to validate current file
-        if validate_json_file(accounts_file):
-            return True  # File is fine
-            
-        print("Accounts file appears to be corrupted.")
+        # Try to parse current file (one read, no separate exists() check)
+        try:
+            for _ in _iter_records(accounts_file):
+                pass
+            return True  # File is fine, load_accounts will accept it
+        except FileNotFoundError:
+            file_found = False
+        except ValueError:
+            file_found = True
         
-        # Create backup of corrupted file
-        corrupted_backup = pathlib.Path("accounts_corrupted_backup.json")
-        if accounts_file.exists():
-            accounts_file.rename(corrupted_backup)
-            print(f"Corrupted file backed up as: {corrupted_backup}")
-        
-        # Create new empty accounts file
-        accounts_file.write_text("[]")
-        print("Created new empty accounts file.")
+        _replace_corrupted_file(accounts_file, file_found)
         return False
         
     except Exception as e:
-        print(f"Error repairing accounts file: {e}")
+        logger.error("Error repairing accounts file: %s", e)
         return False
 
+def _replace_corrupted_file(accounts_file: pathlib.Path, file_found: bool) -> None:
+    """
+    Move a corrupted accounts file aside and start a new empty one.
+    
+    Args:
+        accounts_file (pathlib.Path): Path to accounts file
+        file_found (bool): Whether the corrupted file exists and should be backed up
+    """
+    logger.warning("Accounts file appears to be corrupted.")
+    
+    # Create backup of corrupted file
+    corrupted_backup = pathlib.Path("accounts_corrupted_backup.ndjson")
+    if file_found:
+        if accounts_file == _fd_file:
+            _close_fd()  # Descriptor would follow the renamed file
+        accounts_file.rename(corrupted_backup)
+        logger.warning("Corrupted file backed up as: %s", corrupted_backup)
+    
+    # Create new empty accounts file
+    os.close(os.open(accounts_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _FILE_MODE))
+    # Callers may still hold accounts that are not in the new file, so the
+    # next save must be a full rewrite rather than patching an empty index
+    _set_record_index(None, {}, 0)
+    logger.info("Created new empty accounts file.")
+
 def create_save_directory() -> pathlib.Path:
     """
     Create a save directory for storing game data (optional alternative location).
@@ -183,9 +747,9 @@ def create_save_directory() -> pathlib.Path:
     save_dir = pathlib.Path("save")
     try:
         save_dir.mkdir(exist_ok=True)
-        print(f"Save directory ready: {save_dir}")
+        logger.info("Save directory ready: %s", save_dir)
     except OSError as e:
-        print(f"Error creating save directory: {e}")
+        logger.error("Error creating save directory: %s", e)
     
     return save_dir
 
@@ -197,20 +761,24 @@ def cleanup_old_backups(max_backups: int = 5) -> None:
         max_backups (int): Maximum number of backup files to keep
     """
     try:
-        # Find all backup files
-        backup_files = list(pathlib.Path(".").glob("accounts_*.json"))
-        backup_files = [f for f in backup_files if f.name != "accounts.json"]
+        # Find all backup files in a single directory scan
+        with os.scandir(".") as entries:
+            backup_files = [
+                entry for entry in entries
+                if entry.name.startswith("accounts_") and entry.name.endswith((".ndjson", ".ndjson.zst"))
+                and entry.name != _ACCOUNTS_FILE and entry.is_file()
+            ]
         
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # Sort by modification time (newest first); DirEntry caches its stat()
+        backup_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
         
         # Remove excess backups
         for old_backup in backup_files[max_backups:]:
-            old_backup.unlink()
-            print(f"Removed old backup: {old_backup}")
+            os.unlink(old_backup.path)
+            logger.debug("Removed old backup: %s", old_backup.name)
             
     except Exception as e:
-        print(f"Error cleaning up backups: {e}")
+        logger.error("Error cleaning up backups: %s", e)
 
 def get_accounts_file_info(accounts_file: pathlib.Path) -> Dict[str, Any]:
     """
@@ -223,7 +791,7 @@ def get_accounts_file_info(accounts_file: pathlib.Path) -> Dict[str, Any]:
         Dict[str, Any]: File information including size, account count, etc.
     """
     info = {
-        "exists": accounts_file.exists(),
+        "exists": False,
         "size_bytes": 0,
         "account_count": 0,
         "is_valid_json": False,
@@ -231,18 +799,22 @@ def get_accounts_file_info(accounts_file: pathlib.Path) -> Dict[str, Any]:
     }
     
     try:
-        if accounts_file.exists():
-            stat = accounts_file.stat()
-            info["size_bytes"] = stat.st_size
-            info["last_modified"] = stat.st_mtime
-            
-            if validate_json_file(accounts_file):
-                info["is_valid_json"] = True
-                with open(accounts_file, 'r') as f:
-                    data = json.load(f)
-                    info["account_count"] = len(data)
+        # A single stat() tells us whether the file exists and gives size/mtime
+        stat = accounts_file.stat()
+        info["exists"] = True
+        info["size_bytes"] = stat.st_size
+        info["last_modified"] = stat.st_mtime
+        
+        # Parse once for both the validity check and the account count
+        try:
+            info["account_count"] = sum(1 for _ in _iter_records(accounts_file, stat.st_size))
+            info["is_valid_json"] = True
+        except ValueError:
+            pass
                     
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        print(f"Error getting file info: {e}")
+        logger.error("Error getting file info: %s", e)
     
     return info 
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Hangman Game - Storage Tests
+Checks that saving through the record index (in-place overwrites, appends
+and full-rewrite fallbacks) always leaves accounts.ndjson loadable and
+complete. Run with: python -m unittest test_storage
+"""
+
+import logging
+import os
+import pathlib
+import tempfile
+import unittest
+from typing import Dict, Any
+
+import storage
+
+
+def make_account(username: str, wins: int = 0) -> Dict[str, Any]:
+    """
+    Build a minimal account record for the tests.
+
+    Args:
+        username (str): Account username
+        wins (int): Lifetime wins
+
+    Returns:
+        Dict[str, Any]: Account dictionary
+    """
+    return {"name": username.title(), "username": username, "wins": wins}
+
+
+class RecordIndexTests(unittest.TestCase):
+    """Saves through the record index must round-trip through load_accounts."""
+
+    def setUp(self) -> None:
+        self._old_cwd = os.getcwd()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp_dir.name)
+        self._old_threshold = storage._MMAP_THRESHOLD
+        self._old_orjson = storage.orjson
+        logging.disable(logging.CRITICAL)  # Corruption tests log on purpose
+
+        storage._close_fd()
+        storage._set_record_index(None, {}, 0)
+        self.accounts_file = pathlib.Path(storage._ACCOUNTS_FILE)
+
+    def tearDown(self) -> None:
+        storage._close_fd()
+        storage._set_record_index(None, {}, 0)
+        storage._MMAP_THRESHOLD = self._old_threshold
+        storage.orjson = self._old_orjson
+        logging.disable(logging.NOTSET)
+        os.chdir(self._old_cwd)
+        self._tmp_dir.cleanup()
+
+    def write_lines(self, data: bytes) -> None:
+        """Write raw file contents, dropping any held descriptor or index first."""
+        storage._close_fd()
+        storage._set_record_index(None, {}, 0)
+        self.accounts_file.write_bytes(data)
+
+    def save_and_reload(self, accounts: Dict[str, Dict[str, Any]], *dirty: str) -> Dict[str, Dict[str, Any]]:
+        """Dirty-set save the given usernames, then load the file back from scratch."""
+        self.assertTrue(storage.save_accounts(accounts, self.accounts_file, dirty=set(dirty)))
+        storage._close_fd()
+        return storage.load_accounts(self.accounts_file)
+
+    def test_shrunk_record_is_overwritten_in_place(self) -> None:
+        accounts = {"a": make_account("a", wins=12345), "b": make_account("b")}
+        storage.save_accounts(accounts, self.accounts_file)
+        size = self.accounts_file.stat().st_size
+        inode = self.accounts_file.stat().st_ino
+
+        accounts["a"]["wins"] = 1
+        loaded = self.save_and_reload(accounts, "a")
+
+        self.assertEqual(loaded, accounts)
+        self.assertEqual(self.accounts_file.stat().st_size, size)
+        self.assertEqual(self.accounts_file.stat().st_ino, inode)
+
+    def test_grown_record_falls_back_to_full_rewrite(self) -> None:
+        accounts = {"a": make_account("a"), "b": make_account("b")}
+        storage.save_accounts(accounts, self.accounts_file)
+
+        accounts["a"]["wins"] = 123456789012
+        self.assertEqual(self.save_and_reload(accounts, "a"), accounts)
+
+    def test_new_and_appended_accounts_are_kept(self) -> None:
+        accounts = {"a": make_account("a")}
+        storage.save_accounts(accounts, self.accounts_file)
+
+        accounts["b"] = make_account("b")
+        self.assertEqual(self.save_and_reload(accounts, "b"), accounts)
+
+        accounts["c"] = make_account("c")
+        self.assertTrue(storage.append_account(self.accounts_file, accounts["c"]))
+        accounts["a"]["wins"] = 3
+        self.assertEqual(self.save_and_reload(accounts, "a"), accounts)
+
+    def test_last_line_without_newline(self) -> None:
+        self.write_lines(b'{"username":"a","wins":0}\n{"username":"b","wins":0}')
+        accounts = storage.load_accounts(self.accounts_file)
+
+        accounts["b"]["wins"] = 7
+        accounts["c"] = make_account("c")
+        self.assertEqual(self.save_and_reload(accounts, "b", "c"), accounts)
+
+    def test_crlf_line_endings(self) -> None:
+        self.write_lines(b'{"username":"a","wins":10}\r\n{"username":"b","wins":0}\r\n')
+        accounts = storage.load_accounts(self.accounts_file)
+
+        accounts["a"]["wins"] = 2
+        accounts["b"]["wins"] = 99
+        self.assertEqual(self.save_and_reload(accounts, "a", "b"), accounts)
+
+    @unittest.skipIf(storage.orjson is None, "mmap path needs orjson")
+    def test_mmap_path_skips_whitespace_lines(self) -> None:
+        storage._MMAP_THRESHOLD = 0
+        self.write_lines(b'{"username":"a","wins":0}\n   \n\n{"username":"b","wins":0}\n \t \n')
+        accounts = storage.load_accounts(self.accounts_file)
+        self.assertEqual(sorted(accounts), ["a", "b"])
+
+        accounts["b"]["wins"] = 5
+        self.assertEqual(self.save_and_reload(accounts, "b"), accounts)
+
+    def test_dirty_save_after_corrupted_file_keeps_all_accounts(self) -> None:
+        self.write_lines(b'{"username":"a"}\nnot json\n')
+        self.assertEqual(storage.load_accounts(self.accounts_file), {})
+        self.assertTrue(pathlib.Path("accounts_corrupted_backup.ndjson").exists())
+
+        # Accounts still held in memory must all reach the new file
+        accounts = {"a": make_account("a"), "b": make_account("b")}
+        self.assertEqual(self.save_and_reload(accounts, "a"), accounts)
+
+    def test_unchanged_full_save_is_skipped(self) -> None:
+        accounts = {"a": make_account("a"), "b": make_account("b")}
+        storage.save_accounts(accounts, self.accounts_file)
+        inode = self.accounts_file.stat().st_ino
+
+        storage.save_accounts(accounts, self.accounts_file)
+        self.assertEqual(self.accounts_file.stat().st_ino, inode)
+
+        # After an in-place update the next full save must really write
+        accounts["a"]["wins"] = 1
+        storage.save_accounts(accounts, self.accounts_file, dirty={"a"})
+        accounts["b"]["wins"] = 2
+        storage.save_accounts(accounts, self.accounts_file)
+        self.assertNotEqual(self.accounts_file.stat().st_ino, inode)
+
+        storage._close_fd()
+        self.assertEqual(storage.load_accounts(self.accounts_file), accounts)
+
+
+class StdlibJsonRecordIndexTests(RecordIndexTests):
+    """The same checks with orjson unavailable, using the json module."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        storage.orjson = None
+
+
+if __name__ == "__main__":
+    unittest.main()